@@ -3,6 +3,7 @@ from ..util import BotSyntaxError
 from .. import util, settings
 from ..bot import PluginAPI
 
+import functools
 import logging
 import random
 
@@ -14,22 +15,24 @@ _log.setLevel(logging.DEBUG)
 class KarmaModule(BotBehaviorModule):
 
 	def __init__(self, resource_root: str):
-		help_text = "The karma system assigns arbitrary points to users (and generic things) and allows other uses to"
-		help_text += " increase or decrease the number of karma points.\n\nTo change the number of points, mention a"
-		help_text += " user or any item followed by a '++' or '--' to increase or decrease their karma. Add more"
-		help_text += " '+'/'-' characters to change the amount by even more.\n\nTo view the amount of karma, use the"
-		help_text += " `karma` command followed by the mention of the user to check (or the name of the thing to"
-		help_text += " check). As a shortcut, you can view your own karma by invoking `karma` with no arguments.\n\n"
-		help_text += "Additionally, if you want to check the karma leaderboard for this server, you can view it by"
-		help_text += " invoking `karma-top` with no arguments.\n\n"
-		help_text += "If you would like to see a user's global karma (or your own global karma), simply add a `global`"
-		help_text += " to the end of the command (e.g. `karma global` to see your own, `karma @user global` to see"
-		help_text += " another user's global karma).\n\n"
-		help_text += "To see the top list for the server, you can do `!karma-top`.\n\n"
-		help_text += "__Settings__\n"
-		help_text += " * `buzzkill-limit` - The maximum amount that karma can change by. Setting to anything less than 1"
-		help_text += " disables buzzkill mode entirely, allowing any amount of karma change.\n"
-		help_text += " * `tsundere-chance` - How likely I am to act tsundere when increasing karma."
+		help_text = (
+			"The karma system assigns arbitrary points to users (and generic things) and allows other uses to"
+			" increase or decrease the number of karma points.\n\nTo change the number of points, mention a"
+			" user or any item followed by a '++' or '--' to increase or decrease their karma. Add more"
+			" '+'/'-' characters to change the amount by even more.\n\nTo view the amount of karma, use the"
+			" `karma` command followed by the mention of the user to check (or the name of the thing to"
+			" check). As a shortcut, you can view your own karma by invoking `karma` with no arguments.\n\n"
+			"Additionally, if you want to check the karma leaderboard for this server, you can view it by"
+			" invoking `karma-top` with no arguments.\n\n"
+			"If you would like to see a user's global karma (or your own global karma), simply add a `global`"
+			" to the end of the command (e.g. `karma global` to see your own, `karma @user global` to see"
+			" another user's global karma).\n\n"
+			"To see the top list for the server, you can do `!karma-top`.\n\n"
+			"__Settings__\n"
+			" * `buzzkill-limit` - The maximum amount that karma can change by. Setting to anything less than 1"
+			" disables buzzkill mode entirely, allowing any amount of karma change.\n"
+			" * `tsundere-chance` - How likely I am to act tsundere when increasing karma."
+		)
 
 		super().__init__(
 			name="karma",
@@ -67,8 +70,6 @@ class KarmaModule(BotBehaviorModule):
 			await self.show_toplist_karma(bot)
 
 	async def on_regex_match(self, bot: PluginAPI, metadata: util.MessageMetadata, *match_groups: str):
-		msg = None
-
 		is_channel = match_groups[1] == '#'
 		is_role = match_groups[2] == '&'
 		if is_role:
@@ -76,6 +77,10 @@ class KarmaModule(BotBehaviorModule):
 		elif is_channel:
 			raise BotSyntaxError("That's sort of a channel so I don't think I can really give that karma!")
 		user = int(match_groups[3])
+		if user == bot.get_user().id:
+			await bot.reply("You cannot set karma on yourself!")
+			return
+
 		amount_str = match_groups[4]
 		amount = len(amount_str) - 1
 
@@ -84,19 +89,13 @@ class KarmaModule(BotBehaviorModule):
 
 		buzzkill_limit = await bot.get_setting('buzzkill-limit')
 
-		if amount is not None:
-			if user == bot.get_user().id:
-				msg = "You cannot set karma on yourself!"
-			elif abs(amount) > buzzkill_limit > 0:
-				msg = "Buzzkill mode enabled;"
-				msg += " karma change greater than " + str(buzzkill_limit) + " not allowed"
-			else:
-				if bot.context.is_pm:
-					msg = await self.add_user_karma(bot, user, 0, amount)
-				else:
-					msg = await self.add_user_karma(bot, user, bot.get_guild().id, amount)
-		if msg is not None:
-			await bot.reply(msg)
+		if abs(amount) > buzzkill_limit > 0:
+			msg = "Buzzkill mode enabled; karma change greater than " + str(buzzkill_limit) + " not allowed"
+		elif bot.context.is_pm:
+			msg = await self.add_user_karma(bot, user, 0, amount)
+		else:
+			msg = await self.add_user_karma(bot, user, bot.get_guild().id, amount)
+		await bot.reply(msg)
 
 	async def show_karma(self, bot: PluginAPI, args):
 		"""
@@ -158,25 +157,26 @@ class KarmaModule(BotBehaviorModule):
 			else:
 				break
 
-		msg = "Sure! Here is a list of the top karma earners in this server.\n\n"
+		parts = ["Sure! Here is a list of the top karma earners in this server.\n\n"]
 		if usridx == tkslen:		# Checks if user is in the karma list
-			msg += "```{:^32.32} {:^1} | {} karma\n{:^53.49}\n".format(bot.get_user().name, "-", 0, "━"*49)
+			parts.append("```{:^32.32} {:^1} | {} karma\n{:^53.49}\n".format(bot.get_user().name, "-", 0, "━"*49))
 		else:
 			member_name = bot.get_guild().get_member(temp_karma_sorted[usridx][0]).name
 			member_amount = temp_karma_sorted[usridx][1][server]
-			msg += "```{:^32.32} {:^1} | {} karma\n{:^53.49}\n".format(member_name, usridx + 1, member_amount, "━" * 49)
-
-		for i in range(0, 5):		# Appends top 5 karma values in server if applicable
-			if tkslen > i:
-				snowflake_id = temp_karma_sorted[i][0]
-				user_obj = bot.get_user(snowflake_id)
-				if user_obj is None:
-					struserid = "User " + str(type(snowflake_id))
-				else:
-					struserid = user_obj.name
-				karmaval = temp_karma_sorted[i][1][server]
-				msg += "{:^32.32} {:^1} | {} karma\n".format(struserid, i + 1, karmaval)
-		msg += "```"
+			parts.append(
+				"```{:^32.32} {:^1} | {} karma\n{:^53.49}\n".format(member_name, usridx + 1, member_amount, "━" * 49)
+			)
+
+		for i in range(min(5, tkslen)):		# Appends top 5 karma values in server if applicable
+			snowflake_id, server_karma = temp_karma_sorted[i]
+			user_obj = bot.get_user(snowflake_id)
+			if user_obj is None:
+				struserid = "Unknown User (" + str(snowflake_id) + ")"
+			else:
+				struserid = user_obj.name
+			parts.append("{:^32.32} {:^1} | {} karma\n".format(struserid, i + 1, server_karma[server]))
+		parts.append("```")
+		msg = "".join(parts)
 
 		await bot.reply(msg)
 
@@ -188,25 +188,21 @@ class KarmaModule(BotBehaviorModule):
 		:param server_id: server id for local karma
 		"""
 
-		amt = 0
-
-		if uuid in self._karma:
+		entry = self._karma.get(uuid)
+		if entry is None:
+			amt = 0
+		else:
 			# convert old karma format to new karma format
-			if isinstance(self._karma[uuid], int):
-				self._karma[uuid] = {server_id: self._karma[uuid]}
+			if isinstance(entry, int):
+				entry = {server_id: entry}
+				self._karma[uuid] = entry
 
 			if global_karma:
-				amt = 0
-				for i in self._karma[uuid]:
-					amt += self._karma[uuid][i]
+				amt = sum(entry.values())
 			else:
-				amt = self._karma[uuid].get(server_id, 0)
+				amt = entry.get(server_id, 0)
 
-		if global_karma:
-			msg = "<@" + str(uuid) + ">'s global karma is at " + str(amt) + "."
-		else:
-			msg = "<@" + str(uuid) + ">'s karma is at " + str(amt) + "."
-		return msg
+		return _format_karma(uuid, amt, global_karma)
 
 	async def add_user_karma(self, bot: PluginAPI, uuid, server_id, amount):
 		# fix for user's still in old karma format, gives current karma
@@ -224,17 +220,26 @@ class KarmaModule(BotBehaviorModule):
 
 		self._karma[uuid][server_id] += amount
 
+		uid_s = str(uuid)
 		new_total = str(self._karma[uuid][server_id])
-		_log.debug("Modified karma of user " + str(uuid) + " by " + str(amount) + "; new total " + new_total)
+		_log.debug("Modified karma of user %s by %s; new total %s", uid_s, amount, new_total)
 
 		tsundere_chance = await bot.get_setting('tsundere-chance')
 		if random.random() < tsundere_chance and amount > 0:
-			msg = "F-fine, <@" + str(uuid) + ">'s karma is now " + str(self._karma[uuid][server_id])
+			msg = "F-fine, <@" + uid_s + ">'s karma is now " + new_total
 			msg += ". B-b-but it's not like I like"
 			msg += " them or anything weird like that. So don't get the wrong idea! B-baka..."
 		else:
-			msg = "Okay! <@" + str(uuid) + ">'s karma is now " + str(self._karma[uuid][server_id])
+			msg = "Okay! <@" + uid_s + ">'s karma is now " + new_total
 		return msg
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_karma(uuid: int, amt: int, global_karma: bool) -> str:
+	# amt is part of the key, so a change in karma never returns a stale reply
+	if global_karma:
+		return "<@" + str(uuid) + ">'s global karma is at " + str(amt) + "."
+	return "<@" + str(uuid) + ">'s karma is at " + str(amt) + "."
+
+
 BOT_MODULE_CLASS = KarmaModule
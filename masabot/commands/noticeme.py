@@ -1,4 +1,5 @@
 import asyncio
+import collections
 
 from . import BotBehaviorModule, RegexTrigger, MentionTrigger, mention_target_self, noticeme_analysis
 from .. import settings, util
@@ -6,11 +7,17 @@ from ..bot import PluginAPI
 
 import logging
 import random
+import re
+from typing import Set
 
 _log = logging.getLogger(__name__)
 _log.setLevel(logging.DEBUG)
 
-positive_responses = [
+# bound once so the mention handler does not look them up on the random module for every message
+_choice = random.choice
+_random = random.random
+
+positive_responses = (
 	"Oh, thanks!",
 	"Eheheh ^_^",
 	"Do you really think so? :O",
@@ -21,34 +28,45 @@ positive_responses = [
 	"I'm so glad you think so!",
 	"I'm always happy to help!",
 	"Haiiiiiiiii!",
-]
+)
 
-negative_responses = [
+negative_responses = (
 	"I'm sorry!",
 	"Oh, oh no... I didn't mean to be a bother :c",
 	"Fuwawawaaaaaa @_@",
-	":("
+	":(",
 	"P-please, I didn't mean to be bad.",
 	"Oh no oh no oh no! I'm really sorry!",
 	"Oh.",
 	"Did you have to do that?"
-]
+)
 
-positive_thanks_responses = [
+positive_thanks_responses = (
 	"Of course!",
 	"You're very welcome, I'm glad I could help!",
 	"A good bot does what she can to help out!",
 	"You don't have to thank me!",
 	"I'm just happy to help make you happy!"
-]
+)
 
-neutral_mention_reactions = [
+neutral_mention_reactions = (
 	"👋",
 	"👀",
 	"❗",
 	"😀",
 	"❤️",
-]
+)
+
+# my name as it appears in messages; the regex trigger fires on it and the handler uses it to pick out lines
+_NAME_PATTERN = r'(?i)\bmasa(?:bot)?\b'
+_NAME_RE = re.compile(_NAME_PATTERN)
+
+# how many handled message IDs to remember for de-duplicating triggers
+_MAX_RECENT_IDS = 256
+
+# delayed reactions that are still running. the event loop only holds weak references to tasks, so without this one
+# could be garbage collected before it gets to react.
+_pending_reactions: Set[asyncio.Future] = set()
 
 
 class NoticeMeSenpaiModule(BotBehaviorModule):
@@ -62,7 +80,7 @@ class NoticeMeSenpaiModule(BotBehaviorModule):
 			help_text=help_text,
 			triggers=[
 				MentionTrigger(target=mention_target_self()),
-				RegexTrigger(r'.*\b[Mm][Aa][Ss][Aa](?:[Bb][Oo][Tt])?\b.*'),
+				RegexTrigger(_NAME_PATTERN),
 			],
 			resource_root=resource_root,
 			settings=[
@@ -72,67 +90,93 @@ class NoticeMeSenpaiModule(BotBehaviorModule):
 			]
 		)
 
+		self._recent_ids = collections.OrderedDict()
+		""":type : collections.OrderedDict[int, bool]"""
+
 	async def on_regex_match(self, bot: PluginAPI, metadata: util.MessageMetadata, *match_groups: str):
-		await self._handle_mention(bot, match_groups[0])
+		message = bot.context.message
+		text = message.content if message is not None else match_groups[0]
+		# the trigger only matches the name itself; only the lines that name me are about me, so analyze just those
+		named_lines = "\n".join(line for line in text.splitlines() if _NAME_RE.search(line))
+		await self._handle_mention(bot, named_lines)
 
 	async def on_mention(self, bot: PluginAPI, metadata, message: str, mentions):
 		await self._handle_mention(bot, message)
 
-	# noinspection PyMethodMayBeStatic
 	async def _handle_mention(self, bot: PluginAPI, message_text: str):
+		# a message that both @-mentions me and says my name fires both triggers; only react to it once
+		if bot.context.message is not None:
+			mid = bot.context.message.id
+			if mid in self._recent_ids:
+				return
+			self._recent_ids[mid] = True
+			if len(self._recent_ids) > _MAX_RECENT_IDS:
+				self._recent_ids.popitem(last=False)
+
 		analysis_chunks = message_to_analyzable_chunks(message_text)
-		if len(analysis_chunks) < 1:
+		if not analysis_chunks:
 			return
 		worst_sentiment = None
 		neutral_present = False
-		for message_text in analysis_chunks:
-			sentiment = noticeme_analysis.analyze_sentiment(message_text)
+		for chunk in analysis_chunks:
+			sentiment = noticeme_analysis.analyze_sentiment(chunk)
 			if sentiment == 0:
 				neutral_present = True
 				continue  # neutrals are checked next if no other is found
-			if worst_sentiment is None:
-				worst_sentiment = sentiment
-			elif sentiment < worst_sentiment:
+			if worst_sentiment is None or sentiment < worst_sentiment:
 				worst_sentiment = sentiment
+			if worst_sentiment < 0:
+				break  # nothing is worse than negative, so the remaining chunks can't change the result
 		if worst_sentiment is not None:
 			_log.debug("got a mention; sentiment score is {:d}".format(worst_sentiment))
 			if worst_sentiment > 0:
 				if noticeme_analysis.contains_thanks(
 						message_text, bot.get_bot_id(), "masabot", "masa", "masachan", "masa-chan"):
-					reply_text = random.choice(positive_thanks_responses)
+					reply_text = _choice(positive_thanks_responses)
 				else:
-					reply_text = random.choice(positive_responses)
+					reply_text = _choice(positive_responses)
 				await bot.reply(reply_text)
 			elif worst_sentiment < 0:
-				await bot.reply(random.choice(negative_responses))
+				await bot.reply(_choice(negative_responses))
 		elif neutral_present:
-			if random.random() < await bot.get_setting('neutral_reaction_chance'):
-				emoji_text = random.choice(neutral_mention_reactions)
+			if _random() < await bot.get_setting('neutral_reaction_chance'):
+				emoji_text = _choice(neutral_mention_reactions)
 				min_reaction_delay_ms = await bot.get_setting('min_reaction_delay_ms')
 				max_reaction_delay_ms = await bot.get_setting('max_reaction_delay_ms')
 				# give a slight delay
 				# random amount from min to max ms
-				delay = min_reaction_delay_ms + (random.random() * (max_reaction_delay_ms - min_reaction_delay_ms))
-				await asyncio.sleep((delay / 1000))
-				await bot.react(emoji_text)
+				delay = min_reaction_delay_ms + (_random() * (max_reaction_delay_ms - min_reaction_delay_ms))
+				# hand the delay to the event loop's timer heap rather than keeping this handler suspended for it
+				asyncio.get_event_loop().call_later(delay / 1000, _start_delayed_reaction, bot, emoji_text)
+
+
+def _start_delayed_reaction(bot: PluginAPI, emoji_text: str):
+	task = asyncio.ensure_future(_delayed_reaction(bot, emoji_text))
+	_pending_reactions.add(task)
+	task.add_done_callback(_pending_reactions.discard)
+
+
+async def _delayed_reaction(bot: PluginAPI, emoji_text: str):
+	# noinspection PyBroadException
+	try:
+		await bot.react(emoji_text)
+	except Exception:
+		_log.exception("Could not react to mention with " + repr(emoji_text))
+
+
+# a sentence that isn't just whitespace, starting from its first non-space character
+_SENTENCE_RE = re.compile(r'[^.\s][^.]*')
 
 
 def message_to_analyzable_chunks(text: str):
 	chunks = []
-	paras = text.split('\n')
-	for p in paras:
-		sents = p.split('.')
-		candidate = None
-		has_more_than_one = False
-		for s in sents:
-			if s.strip(" \t\n\r\v") != "":
-				if candidate is None:
-					candidate = s
-				else:
-					has_more_than_one = True
-					break
-		if not has_more_than_one and candidate is not None:
-			chunks.append(candidate)
+	# splitlines() also breaks on \r and \r\n, so CRLF messages don't leave a stray \r on each paragraph
+	for p in text.splitlines():
+		# only a paragraph with exactly one non-empty sentence is kept
+		sentences = _SENTENCE_RE.finditer(p)
+		first = next(sentences, None)
+		if first is not None and next(sentences, None) is None:
+			chunks.append(first.group())
 	return chunks
 
 
@@ -1,3 +1,4 @@
+import functools
 import re
 import logging
 _log = logging.getLogger(__name__)
@@ -30,54 +31,55 @@ negative_words = [
 	"isn't working"
 ]
 
+_POLARITY = {w.lower(): 1 for w in positive_words}
+_POLARITY.update({w.lower(): -1 for w in negative_words})
 
+# words for the substring gate in analyze_sentiment. Any word containing another word is left out; if the longer
+# word is present then so is the shorter one, so checking it again can never change the result.
+_ALL_SENTIMENT_WORDS = tuple(w for w in _POLARITY if not any(o != w and o in w for o in _POLARITY))
+
+# every word in one alternation, tried in sorted order. The first word in sorted order that is found anywhere in
+# the text decides the result, regardless of where in the text it is, so the scan has to see all of them; the
+# lookahead keeps each match from consuming text so that overlapping words are all found. Words that can match at the
+# same place are prefixes of one another, and a prefix sorts first, so the one captured there is the first in order.
+_SENTIMENT_RE = re.compile(r"(?=\b(" + "|".join(re.escape(w) for w in sorted(_POLARITY)) + r")\b)")
+
+
+@functools.lru_cache(maxsize=32)
 def pattern_for_mention(uid: int, name: str, *more_names) -> str:
-	patt = r"(?:<@!?" + str(uid) + r">|"
-	for ch in name:
-		patt += "[" + re.escape(ch.lower()) + re.escape(ch.upper()) + "]"
-	for additional_name in more_names:
-		patt += "|"
-		for ch in additional_name:
-			patt += "[" + re.escape(ch.lower()) + re.escape(ch.upper()) + "]"
-	patt += ")"
-	return patt
+	names = "|".join(re.escape(n) for n in (name,) + more_names)
+	return r"(?:<@!?" + str(uid) + r">|(?i:" + names + r"))"
 
 
-def contains_thanks(text: str, to_user_id: int, to_user_name: str, *more_user_names) -> bool:
+@functools.lru_cache(maxsize=32)
+def _thanks_patterns(to_user_id: int, to_user_name: str, *more_user_names):
 	thank_you_pattern = r"(?:thank|thanks|thank\s+you|thx)"
 	mention_pattern = pattern_for_mention(to_user_id, to_user_name, *more_user_names)
 	left_pattern = re.compile(thank_you_pattern + r"[\s,]+" + mention_pattern, re.IGNORECASE)
 	right_pattern = re.compile(mention_pattern + r"[\s,]+" + thank_you_pattern, re.IGNORECASE)
+	return left_pattern, right_pattern
 
-	if left_pattern.search(text):
-		return True
-	if right_pattern.search(text):
-		return True
-	return False
+
+@functools.lru_cache(maxsize=4096)
+def contains_thanks(text: str, to_user_id: int, to_user_name: str, *more_user_names) -> bool:
+	left_pattern, right_pattern = _thanks_patterns(to_user_id, to_user_name, *more_user_names)
+	return bool(left_pattern.search(text) or right_pattern.search(text))
 
 
+@functools.lru_cache(maxsize=4096)
 def analyze_sentiment(message_text):
 	"""
 	Returns 1 for positive, 0 for neutral, -1 for negative.
 	:param message_text:
 	:return:
 	"""
-	all_words = {k.lower(): True for k in positive_words}
-	all_words.update({k.lower(): False for k in negative_words})
-	all_word_patterns = list(all_words.keys())
-	all_word_patterns.sort()
+	# cheap substring gate; the regex below can only match if one of the words is present
+	lowered = message_text.lower()
+	if not any(w in lowered for w in _ALL_SENTIMENT_WORDS):
+		return 0
 
-	found = False
-	positive = False
-	for p in all_word_patterns:
-		m = re.search(r"\b" + p + r"\b", message_text, re.IGNORECASE | re.MULTILINE)
-		if m:
-			found = True
-			positive = all_words[p]
-			break
+	# the text is already lowercased for the gate, so the scan can be a plain case-sensitive one
+	found = {m.group(1) for m in _SENTIMENT_RE.finditer(lowered)}
 	if not found:
 		return 0
-	if positive:
-		return 1
-	return -1
-
+	return _POLARITY[min(found)]
@@ -1,13 +1,32 @@
+from typing import Any
+
 from ..util import BotSyntaxError
 from . import BotBehaviorModule, InvocationTrigger
 from .. import util, settings
 from ..bot import PluginAPI
 
+import functools
 import logging
 
 _log = logging.getLogger(__name__)
 _log.setLevel(logging.DEBUG)
 
+# (emoji, comment) for each rating, indexed by the rating itself. Comments are format strings that may refer to the
+# rated waifu as {waifu}.
+_RATING_MESSAGES = (
+	None,
+	("❌", "Woah, uh... I didn't think anybody could like {waifu}... Oh! But it's okay if you do!"),
+	("🗑️", "That's pretty awful! @_@"),
+	("🚮", "But, I don't quite understand why you like them! :O"),
+	("🙁", "Yeah, I guess they're okay!"),
+	("😐", "I think you two would be good together!"),
+	("🙂", "Heehee, actually I kinda like them, too! Oh, but I'd never get in your way!"),
+	("😃", "Oh my gosh, good choice! You must have really good taste!"),
+	("😅", "Woah, gosh, ahaha, yeah they, they make me feel all nervous, heheheh"),
+	("❤️", "Ahahaha yes! Yes! They are amazing!"),
+	("😍", "You better get them before *I* do!"),
+)
+
 
 class RateWaifuModule(BotBehaviorModule):
 	def __init__(self, resource_root: str):
@@ -35,32 +54,20 @@ class RateWaifuModule(BotBehaviorModule):
 			raise BotSyntaxError("I need to know who you want me to rate!")
 		waifu = str(args[0])
 		seed = await bot.get_setting('seed')
-		rating = (hash(waifu.lower() + seed) % 10) + 1
-		rate_msg = "I'd give " + waifu + " a " + str(rating) + "/10."
-		if rating == 1:
-			msg = "❌ **|** " + rate_msg + " Woah, uh... I didn't think anybody could like " + waifu + "..."
-			msg += " Oh! But it's okay if you do!"
-		elif rating == 2:
-			msg = "🗑️ **|** " + rate_msg + " That's pretty awful! @_@"
-		elif rating == 3:
-			msg = "🚮 **|** " + rate_msg + " But, I don't quite understand why you like them! :O"
-		elif rating == 4:
-			msg = "🙁 **|** " + rate_msg + " Yeah, I guess they're okay!"
-		elif rating == 5:
-			msg = "😐 **|** " + rate_msg + " I think you two would be good together!"
-		elif rating == 6:
-			msg = "🙂 **|** " + rate_msg + " Heehee, actually I kinda like them, too! Oh, but I'd never get in your way!"
-		elif rating == 7:
-			msg = "😃 **|** " + rate_msg + " Oh my gosh, good choice! You must have really good taste!"
-		elif rating == 8:
-			msg = "😅 **|** " + rate_msg + " Woah, gosh, ahaha, yeah they, they make me feel all nervous, heheheh"
-		elif rating == 9:
-			msg = "❤️ **|** " + rate_msg + " Ahahaha yes! Yes! They are amazing!"
-		elif rating == 10:
-			msg = "😍 **|** " + rate_msg + " You better get them before *I* do!"
-		else:
-			raise ValueError("expected rating to be between 1 and 10 but was: " + str(rating))
+		rating = _rate(waifu.lower(), seed)
+		emoji, comment = _RATING_MESSAGES[rating]
+		msg = emoji + " **|** I'd give " + waifu + " a " + str(rating) + "/10. " + comment.format(waifu=waifu)
 		await bot.reply(msg)
 
+	async def on_setting_change(self, bot: PluginAPI, key: str, old_value: Any, new_value: Any):
+		if key == 'seed':
+			# ratings for the old seed will never be requested again
+			_rate.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _rate(waifu_lower: str, seed: str) -> int:
+	return (hash(waifu_lower + seed) % 10) + 1
+
 
 BOT_MODULE_CLASS = RateWaifuModule
@@ -1,5 +1,8 @@
+import asyncio
+import collections
 import re
-from typing import Dict, Optional, Any
+import sys
+from typing import Dict, DefaultDict, Optional, Any, Tuple, Union
 
 from . import BotBehaviorModule, ReactionTrigger, InvocationTrigger
 from .. import util
@@ -15,46 +18,65 @@ _log = logging.getLogger(__name__)
 _log.setLevel(logging.DEBUG)
 
 
-# TODO: a lot of this module will fail if state loading fails, because it assumes that sid will exist in its
-# state dicts for any server it is called in, which might not be true. add way to make it true
+_HELP_TEXT = (
+	"The \"rolemanager\" module makes it so I can assign people roles by having them react to a message! "
+	"Anybody who can see the message where the reaction roles are set up will be able to get the role by"
+	" reacting to that message with the right emoji!\n\n"
+	"My operators in a server can create and manage reaction roles with special commands.\n\n"
+	"__Adding A Reaction Role__:\n"
+	"To make a new role message, first create the message you want and put it in any channel that I"
+	" can see. Then, use the `rr-add` command. This will ask what message to add the reaction role to."
+	" You can either give me a link to the message or give the ID of the message directly!\n\n"
+	"Next, I'll ask you for what role you want people to get when they react; you can reply by pinging"
+	" that role in your response!\n\n"
+	"Finally, I'll need the emote that people need to react with to get the role. But, be careful! It"
+	" has to be something that everyone in the server can use, so it's gotta be an emote uploaded to"
+	" your server, or else one of the built-in emotes.\n\n"
+	"And that's it! To add more roles to the same message, just run the `rr-add` command again!\n\n"
+	"__Removing A Reaction Role__:\n"
+	"To remove a role from an existing message, use the `rr-remove` command. This will ask you what"
+	" message to remove the role from. You can either give me a link to the message or the ID of the"
+	" message directly!\n\n"
+	"Next, I'll need to know which role you want to remove. Select the one you want to remove, and"
+	" I'll remove it. If you want to remove *all* the roles, you can use the `!rr-clear` command"
+	" instead.\n\n"
+	"__Naming, Moving, And Copying__:\n"
+	"To rename a role group, use the `rr-rename` command with the old name followed by the new name.\n\n"
+	"To move a role group to another message, use `!rr-move` followed by the name of the group. Or if"
+	" you want, you can use `!rr-copy` followed by the name of the role group and the name of the new"
+	" group to copy it, which will leave it on the old message as well!\n\n"
+	"If you ever need to delete a role group, use `!rr-clear` followed by the name of the group to"
+	" clear. And `!rr-info` will show all the current ones that are named, or if you give a name, info"
+	" on that one!"
+)
+
+
+# command -> (name of handler method, max number of command args passed on to it after the bot)
+_INVOCATION_HANDLERS = {
+	'rr-add': ('add_reactionrole', 1),
+	'rr-remove': ('remove_reactionrole', 0),
+	'rr-clear': ('clear_reactionroles', 0),
+	'rr-rename': ('rename_reactionrole', 1),
+	'rr-copy': ('copy_reactionrole', 2),
+	'rr-move': ('move_reactionrole', 1),
+	'rr-info': ('list_reactionroles', 1),
+}
 
 
 class RoleManagerModule(BotBehaviorModule):
 	def __init__(self, resource_root: str):
-		help_text = "The \"rolemanager\" module makes it so I can assign people roles by having them react to a message!"
-		help_text += "Anybody who can see the message where the reaction roles are set up will be able to get the role by"
-		help_text += " reacting to that message with the right emoji!\n\n"
-		help_text += "My operators in a server can create and manage reaction roles with special commands.\n\n"
-		help_text += "__Adding A Reaction Role__:\n"
-		help_text += "To make a new role message, first create the message you want and put it in any channel that I"
-		help_text += " can see. Then, use the `rr-add` command. This will ask what message to add the reaction role to."
-		help_text += " You can either give me a link to the message or give the ID of the message directly!\n\n"
-		help_text += "Next, I'll ask you for what role you want people to get when they react; you can reply by pinging"
-		help_text += " that role in your response!\n\n"
-		help_text += "Finally, I'll need the emote that people need to react with to get the role. But, be careful! It"
-		help_text += " has to be something that everyone in the server can use, so it's gotta be an emote uploaded to"
-		help_text += " your server, or else one of the built-in emotes.\n\n"
-		help_text += "And that's it! To add more roles to the same message, just run the `rr-add` command again!\n\n"
-		help_text += "__Removing A Reaction Role__:\n"
-		help_text += "To remove a role from an existing message, use the `rr-remove` command. This will ask you what"
-		help_text += " message to remove the role from. You can either give me a link to the message or the ID of the"
-		help_text += " message directly!\n\n"
-		help_text += "Next, I'll need to know which role you want to remove. Select the one you want to remove, and"
-		help_text += " I'll remove it. If you want to remove *all* the roles, you can use the `!rr-clear` command"
-		help_text += " instead.\n\n"
-		help_text += "__Naming, Moving, And Copying__:\n"
-		help_text += "To rename a role group, use the `rr-rename` command with the old name followed by the new name.\n\n"
-		help_text += "To move a role group to another message, use `!rr-move` followed by the name of the group. Or if"
-		help_text += "you want, you can use `!rr-copy` followed by the name of the role group and the name of the new"
-		help_text += " group to copy it, which will leave it on the old message as well!\n\n"
-		help_text += "If you ever need to delete a role group, use `!rr-clear` followed by the name of the group to"
-		help_text += " clear. And `!rr-info` will show all the current ones that are named, or if you give a name, info"
-		help_text += " on that one!"
-		
-		# groups is server -> group -> group_attr -> group_value.
-		self._groups: Dict[int, Dict[str, Dict[str, Any]]] = dict()
+		# groups is server -> group -> group_attr -> group_value. servers that have no state yet get an empty dict on
+		# first access.
+		self._groups: DefaultDict[int, Dict[str, Dict[str, Any]]] = collections.defaultdict(dict)
 		# known messages maps server -> message_id -> name of group within server, None if there isnt one
-		self._known_messages: Dict[int, Dict[int, Optional[str]]] = dict()
+		self._known_messages: DefaultDict[int, Dict[int, Optional[str]]] = collections.defaultdict(dict)
+		# index of (server, message_id) -> the 'emotes' dict of the group on that message. the dicts are shared with
+		# _groups, so only adding, moving, and removing whole groups needs to update this.
+		self._message_emotes: Dict[Tuple[int, int], Dict[Union[str, int], int]] = dict()
+		# ID of the bot user, read on the first reaction event
+		self._bot_id: Optional[int] = None
+		# stand-in for the bot user when removing its reactions; created on first use
+		self._bot_object: Optional[discord.Object] = None
 
 		"""!rr-group-add
 		# * give message
@@ -83,7 +105,7 @@ class RoleManagerModule(BotBehaviorModule):
 		super().__init__(
 			name="rolemanager",
 			desc="Allows for the creation of self-assignable roles.",
-			help_text=help_text,
+			help_text=_HELP_TEXT,
 			triggers=[
 				ReactionTrigger(reacts=True, unreacts=True),
 				InvocationTrigger('rr-add'),
@@ -111,11 +133,6 @@ class RoleManagerModule(BotBehaviorModule):
 				'groups': dict(),
 				'messages': dict(),
 			}
-		# TODO 1.10.0 MIGRATION CODE, remove any time after 1.11.0
-		if None in self._groups[server]:
-			# noinspection PyTypeChecker
-			del self._groups[server][None]
-		# TODO END 1.10.0 MIGRATION CODE
 		return {
 			'groups': self._groups[server],
 			'messages': self._known_messages[server],
@@ -128,61 +145,48 @@ class RoleManagerModule(BotBehaviorModule):
 		if 'messages' not in state:
 			state['messages'] = dict()
 		# TODO END 1.10.x MIGRATION CODE
-		self._groups[server] = state['groups']
-		self._known_messages[server] = state['messages']
+		# TODO 1.10.0 MIGRATION CODE, remove any time after 1.11.0
+		state['groups'].pop(None, None)
+		# TODO END 1.10.0 MIGRATION CODE
+		groups = {sys.intern(name): gr for name, gr in state['groups'].items()}
+		for name, gr in groups.items():
+			gr['name'] = name
+			gr['emotes'] = {_intern_emoji(em): rid for em, rid in gr['emotes'].items()}
+			self._message_emotes[(server, gr['message'])] = gr['emotes']
+		self._groups[server] = groups
+		self._known_messages[server] = {
+			mid: sys.intern(name) if name is not None else None for mid, name in state['messages'].items()
+		}
 
 	async def on_invocation(self, bot: PluginAPI, metadata: util.MessageMetadata, command: str, *args: str):
-		group = None
-		if command == 'rr-add':
-			if len(args) > 0:
-				group = args[0]
-			await self.add_reactionrole(bot, group)
-		elif command == 'rr-remove':
-			await self.remove_reactionrole(bot)
-		elif command == 'rr-clear':
-			await self.clear_reactionroles(bot)
-		elif command == 'rr-rename':
-			if len(args) > 0:
-				group = args[0]
-			await self.rename_reactionrole(bot, group)
-		elif command == 'rr-copy':
-			if len(args) > 0:
-				group = args[0]
-			new_name = None
-			if len(args) > 1:
-				new_name = args[1]
-			await self.copy_reactionrole(bot, group, new_name)
-		elif command == 'rr-move':
-			if len(args) > 0:
-				group = args[0]
-			await self.move_reactionrole(bot, group)
-		elif command == 'rr-info':
-			if len(args) > 0:
-				group = args[0]
-			await self.list_reactionroles(bot, group)
-
-	def get_group(self, server: int, mid: int):
-		return self._groups[server][self._known_messages[server][mid]]
-
-	def set_group(self, server: int, name: Optional[str], group: Dict[str, Any]):
-		group['name'] = name
-		self._groups[server][name] = group
+		handler = _INVOCATION_HANDLERS.get(command)
+		if handler is None:
+			return
+		handler_name, max_args = handler
+		await getattr(self, handler_name)(bot, *args[:max_args])
+
+	def get_bot_object(self, bot: PluginAPI) -> discord.Object:
+		bot_id = bot.get_bot_id()
+		if self._bot_object is None or self._bot_object.id != bot_id:
+			self._bot_object = discord.Object(bot_id)
+		return self._bot_object
 
 	async def on_reaction(self, bot: PluginAPI, metadata: util.MessageMetadata, reaction: util.Reaction):
-		if reaction.user_id == bot.get_bot_id():
+		# most reactions are on messages that aren't managed, so reject those first
+		if not self._message_emotes:
 			return
-		guild = bot.get_guild()
-
-		msg = reaction.source_message
-		if guild.id not in self._known_messages:
+		emotes = self._message_emotes.get((reaction.guild_id, reaction.message_id))
+		if emotes is None:
 			return
-		if msg.id not in self._known_messages[guild.id]:
+		if self._bot_id is None:
+			self._bot_id = bot.get_bot_id()
+		if reaction.user_id == self._bot_id:
 			return
-		if reaction.emoji not in self.get_group(guild.id, msg.id)['emotes']:
+		rid = emotes.get(reaction.emoji)
+		if rid is None:
 			return
 
 		# checks done, this is a managed reaction role.
-		rid = self.get_group(guild.id, msg.id)['emotes'][reaction.emoji]
 
 		if reaction.is_remove:
 			await remove_user_role(bot, reaction, rid)
@@ -194,37 +198,39 @@ class RoleManagerModule(BotBehaviorModule):
 		await bot.require_op("rr-info")
 
 		if group_name is None:
-			if len([x for x in self._groups[sid] if x is not None]) == 0:
+			if not any(x is not None for x in self._groups[sid]):
 				await bot.reply("I don't have any reaction roles in this server yet! Use `rr-add` to create one.")
 				return
-			msg = "Sure! Here are all reaction role groups I currently have defined:\n\n```"
-			for group in self._groups[sid]:
-				if group is None:
-					continue
-				msg += " * " + str(group) + "\n"
-			msg += "```"
-			await bot.reply(msg)
+			group_list = "".join(" * " + str(group) + "\n" for group in self._groups[sid] if group is not None)
+			await bot.reply(
+				"Sure! Here are all reaction role groups I currently have defined:\n\n```" + group_list + "```"
+			)
 		else:
 			orig_name = group_name
 			group_name = normalize_group_name(group_name)
 			if group_name not in self._groups[sid]:
-				msg = "Oh, I'm sorry! I don't have any reaction role groups named `" + orig_name + "`. Try rr-info by"
-				msg += " itself to see what I do have!"
+				msg = (
+					"Oh, I'm sorry! I don't have any reaction role groups named `" + orig_name + "`. Try rr-info by"
+					" itself to see what I do have!"
+				)
 				await bot.reply(msg)
 				return
 
 			gr = self._groups[sid][group_name]
 
-			msg = "Sure, here's what I have for that!\n\n"
-			msg += "__Info__\n"
-			msg += "**Name:** `" + gr['name'] + "`\n"
-			msg += "**For MID:** " + str(gr['message']) + "\n\n"
-			msg += "__Emotes:__"
+			msg = (
+				"Sure, here's what I have for that!\n\n"
+				"__Info__\n"
+				"**Name:** `" + gr['name'] + "`\n"
+				"**For MID:** " + str(gr['message']) + "\n\n"
+				"__Emotes:__"
+			)
 
 			if len(gr['emotes']) < 1:
 				msg += " (none)"
 			else:
-				msg += "\n"
+				guild = bot.get_guild(sid)
+				emote_lines = []
 				for em in gr['emotes']:
 					if isinstance(em, str):
 						em_name = em
@@ -238,13 +244,14 @@ class RoleManagerModule(BotBehaviorModule):
 								em_name = "`" + em_name + " (Unusable)`"
 
 					rid = gr['emotes'][em]
-					role = bot.get_guild(sid).get_role(rid)
+					role = guild.get_role(rid)
 					if role is None:
 						r_name = "`(Deleted Role ID " + str(rid) + ")`"
 					else:
 						r_name = "`@" + role.name + "`"
 
-					msg += em_name + " - " + r_name
+					emote_lines.append(em_name + " - " + r_name)
+				msg += "\n" + "\n".join(emote_lines)
 
 			await bot.reply(msg)
 
@@ -254,43 +261,51 @@ class RoleManagerModule(BotBehaviorModule):
 		await bot.require_op("rr-remove")
 
 		if sid not in self._known_messages or len(self._known_messages[sid]) < 1:
-			masamsg = "I would, but there's just one problem! I'm not running any role reactions in this server,"
-			masamsg += " but you can add some with `!rr-add`."
+			masamsg = (
+				"I would, but there's just one problem! I'm not running any role reactions in this server,"
+				" but you can add some with `!rr-add`."
+			)
 			await bot.reply(masamsg)
 			return
 		
 		msg = await bot.select_message("Oh, I have a few of those. Can you tell me the message I should remove a role from?")
 		if msg is None:
-			full_msg = "I'm sorry, but I can't remove a role unless you tell me which message to remove it from!"
-			full_msg += " Do `!rr-remove` to try again."
+			full_msg = (
+				"I'm sorry, but I can't remove a role unless you tell me which message to remove it from!"
+				" Do `!rr-remove` to try again."
+			)
 			raise BotModuleError(full_msg)
 
-		if msg.id not in self._known_messages[sid]:
+		known = self._known_messages[sid]
+		groups = self._groups[sid]
+		if msg.id not in known:
 			raise BotModuleError("That is not a message with role reactions in this server!")
 
-		gr = self.get_group(sid, msg.id)
-		reacts = list(gr['emotes'].keys())
-		if len(reacts) < 1:
+		gr = groups[known[msg.id]]
+		emotes = gr['emotes']
+		if not emotes:
 			raise BotModuleError("I don't have any reaction roles set up on that message.")
 
-		r = await bot.prompt_for_emote_option("Of course! And which reaction should I remove?", reacts)
+		r = await bot.prompt_for_emote_option("Of course! And which reaction should I remove?", list(emotes))
 		if r is None:
 			raise BotModuleError("I need to know the role you want me to remove >.< Do `!rr-remove` to try again.")
 
-		del gr['emotes'][r.emoji]
-		if len(gr['emotes']) == 0:
-			del self._groups[sid][gr['name']]
-			del self._known_messages[sid][msg.id]
+		del emotes[r.emoji]
+		if not emotes:
+			groups.pop(known.pop(msg.id))
+			self._message_emotes.pop((sid, msg.id))
 			bot.unsubscribe_reactions(msg.id)
-			if len(self._known_messages[sid]) == 0:
-				del self._known_messages[sid]
-				del self._groups[sid]
-		await msg.remove_reaction(r.emoji_value, discord.Object(bot.get_bot_id()))
+			if not known:
+				self._known_messages.pop(sid)
+				self._groups.pop(sid)
+		await msg.remove_reaction(r.emoji_value, self.get_bot_object(bot))
 
 		bot.save()
 
-		full_msg = "Yes! The role is no more!"
-		full_msg += " Oh, but any roles that people already had from that will not be automatically removed."
+		full_msg = (
+			"Yes! The role is no more!"
+			" Oh, but any roles that people already had from that will not be automatically removed."
+		)
 		await bot.reply(full_msg)
 
 	async def copy_reactionrole(self, bot: PluginAPI, name: Optional[str] = None, new_name: Optional[str] = None):
@@ -308,14 +323,18 @@ class RoleManagerModule(BotBehaviorModule):
 		sel_msg = "Okay, sure! Which message in this server should I copy the reaction role `" + name + "` to?"
 		msg = await bot.select_message(sel_msg)
 		if msg is None:
-			err_msg = "I'm sorry but I need to know the message you want to copy the role group to!"
-			err_msg += " Use `rr-copy` to try again."
+			err_msg = (
+				"I'm sorry but I need to know the message you want to copy the role group to!"
+				" Use `rr-copy` to try again."
+			)
 			raise BotModuleError(err_msg)
 
 		sid = msg.channel.guild.id
 		if msg.id in self._known_messages[sid]:
-			err_msg = "Oh, it looks like that message already has role group `" + str(self._known_messages[sid][msg.id])
-			err_msg += "` on it. Please remove it before trying to put other roles on this message!"
+			err_msg = (
+				"Oh, it looks like that message already has role group `" + str(self._known_messages[sid][msg.id])
+				+ "` on it. Please remove it before trying to put other roles on this message!"
+			)
 			raise BotModuleError(err_msg)
 
 		if new_name is None:
@@ -326,23 +345,25 @@ class RoleManagerModule(BotBehaviorModule):
 			if new_name in self._groups[sid]:
 				raise BotModuleError("That group already exists, do `rr-copy` to try again!")
 
-		conf_msg = "Certainly, I can copy `" + name + "` there with name `" + new_name + "`. But just so you know, any"
-		conf_msg += " existing user reactions will not be copied. Does that sound okay?"
+		conf_msg = (
+			"Certainly, I can copy `" + name + "` there with name `" + new_name + "`. But just so you know, any"
+			" existing user reactions will not be copied. Does that sound okay?"
+		)
 
 		conf = await bot.confirm(conf_msg)
 		if conf:
 			old_group = self._groups[sid][name]
 			old_mid = old_group['message']
+			emotes = dict(old_group['emotes'])
 			self._known_messages[sid][msg.id] = new_name
 			self._groups[sid][new_name] = {
 				'name': new_name,
-				'emotes': dict(old_group['emotes']),
+				'emotes': emotes,
 				'message': msg.id
 			}
+			self._message_emotes[(sid, msg.id)] = emotes
 			bot.subscribe_reactions(msg.id)
-			for emoji_code in self._groups[sid][name]['emotes']:
-				emoji = await bot.get_emoji_from_value(emoji_code)
-				await msg.add_reaction(emoji)
+			await add_group_reactions(bot, msg, emotes)
 			_log.debug(util.add_context(bot.context, "Copied role group {!r} from MID {:d} to MID {:d}", name, old_mid, msg.id))
 			await bot.reply("Done! I've copied it over to the new message!")
 		else:
@@ -363,18 +384,24 @@ class RoleManagerModule(BotBehaviorModule):
 		sel_msg = "Okay, sure! Which message in this server should I move the reaction role `" + name + "` to?"
 		msg = await bot.select_message(sel_msg)
 		if msg is None:
-			err_msg = "I'm sorry but I need to know the message you want to move the role group to!"
-			err_msg += " Use `rr-move` to try again."
+			err_msg = (
+				"I'm sorry but I need to know the message you want to move the role group to!"
+				" Use `rr-move` to try again."
+			)
 			raise BotModuleError(err_msg)
 
 		sid = msg.channel.guild.id
 		if msg.id in self._known_messages[sid]:
-			err_msg = "Oh, it looks like that message already has role group `" + str(self._known_messages[sid][msg.id])
-			err_msg += "` on it. Please remove it before trying to put other roles on this message!"
+			err_msg = (
+				"Oh, it looks like that message already has role group `" + str(self._known_messages[sid][msg.id])
+				+ "` on it. Please remove it before trying to put other roles on this message!"
+			)
 			raise BotModuleError(err_msg)
 
-		conf_msg = "Certainly, I can move `" + name + "` there. But just so you know, any existing reactions on it"
-		conf_msg += " will not be changed, and any existing by other users will not carry over. Should I move it?"
+		conf_msg = (
+			"Certainly, I can move `" + name + "` there. But just so you know, any existing reactions on it"
+			" will not be changed, and any existing by other users will not carry over. Should I move it?"
+		)
 
 		conf = await bot.confirm(conf_msg)
 		if conf:
@@ -383,9 +410,8 @@ class RoleManagerModule(BotBehaviorModule):
 			del self._known_messages[sid][old_mid]
 			self._known_messages[sid][msg.id] = name
 			self._groups[sid][name]['message'] = msg.id
-			for emoji_code in self._groups[sid][name]['emotes']:
-				emoji = await bot.get_emoji_from_value(emoji_code)
-				await msg.add_reaction(emoji)
+			self._message_emotes[(sid, msg.id)] = self._message_emotes.pop((sid, old_mid))
+			await add_group_reactions(bot, msg, self._groups[sid][name]['emotes'])
 			bot.subscribe_reactions(msg.id)
 			_log.debug(util.add_context(bot.context, "Moved role group {!r} from MID {:d} to MID {:d}", name, old_mid, msg.id))
 			await bot.reply("Done! I've moved it over to the new message!")
@@ -395,11 +421,10 @@ class RoleManagerModule(BotBehaviorModule):
 	async def rename_reactionrole(self, bot: PluginAPI, name: Optional[str] = None, new_name: Optional[str] = None):
 		await bot.require_op("rr-rename")
 
-		opts = list(self._groups[bot.get_guild().id].keys())
-		if len(opts) < 1:
+		sid = await bot.require_server()
+		if not self._groups.get(sid):
 			raise BotModuleError("I don't have any reaction role groups in this server yet! Add one with `rr-add`.")
 
-		sid = await bot.require_server()
 		if name is None:
 			name = await bot.prompt("Which role group do you want to rename?")
 			if name is None:
@@ -416,11 +441,11 @@ class RoleManagerModule(BotBehaviorModule):
 			if new_name in self._groups[sid]:
 				raise BotModuleError("That group already exists, do `rr-rename` to try again!")
 
-		gr = self._groups[sid][name]
-		del self._groups[sid][name]
-		gr.name = new_name
+		gr = self._groups[sid].pop(name)
+		gr['name'] = new_name
 		self._groups[sid][new_name] = gr
-		self._known_messages[gr['message']] = new_name
+		self._known_messages[sid][gr['message']] = new_name
+		bot.save()
 		_log.debug(
 			util.add_context(bot.context, "Renamed role group on MID {:d} from {!r} to `{!r}`", gr['message'], name, new_name)
 		)
@@ -433,19 +458,23 @@ class RoleManagerModule(BotBehaviorModule):
 
 		msg = await bot.select_message("Okay, sure! Which message in this server should I add a reaction role to?")
 		if msg is None:
-			err_msg = "I'm sorry but I don't know what message you want to set up the reactions on!"
-			err_msg += " Use !rr-add to try again."
+			err_msg = (
+				"I'm sorry but I don't know what message you want to set up the reactions on!"
+				" Use !rr-add to try again."
+			)
 			raise BotModuleError(err_msg)
 
 		sid = msg.channel.guild.id
-		if msg.id in self._known_messages[sid]:
-			name = self._known_messages[sid][msg.id]
+		known = self._known_messages[sid]
+		groups = self._groups[sid]
+		if msg.id in known:
+			name = known[msg.id]
 		elif name is None:
 			name = await bot.prompt("Okay! That will be a new role group, so what should I call it?")
 			if name is None:
 				raise BotModuleError("I need you to give me a name for the new role group!")
 			name = normalize_group_name(name)
-			if name in self._groups[sid]:
+			if name in groups:
 				raise BotModuleError("That group already exists, try again!")
 
 		rolemsg = await bot.prompt("Got it! And what role do you want to add?")
@@ -460,30 +489,28 @@ class RoleManagerModule(BotBehaviorModule):
 		if react is None:
 			raise BotModuleError("I'm sorry but I don't know what emoji you want me to add. Use !rr-add to try again.")
 		if not react.is_usable:
-			err_msg = "Oh no, it looks like I can't use that emote, is it from another server?"
-			err_msg += " Use !rr-add to try again."
+			err_msg = (
+				"Oh no, it looks like I can't use that emote, is it from another server?"
+				" Use !rr-add to try again."
+			)
 			raise BotModuleError(err_msg)
 
-		if sid not in self._known_messages:
-			self._known_messages[sid] = dict()
-			self._groups[sid] = dict()
-		if msg.id not in self._known_messages[sid]:
-			self._known_messages[sid][msg.id] = name
-			self._groups[sid][name] = {
+		if msg.id not in known:
+			known[msg.id] = name
+			groups[name] = {
 				'name': name,
 				'emotes': dict(),
 				'message': msg.id
 			}
+			self._message_emotes[(sid, msg.id)] = groups[name]['emotes']
 			bot.subscribe_reactions(msg.id)
 
-		gr = self.get_group(sid, msg.id)
+		gr = groups[name]
 		if react.emoji in gr['emotes']:
-			rid = gr[react.emoji]
-			existing_role = util.Mention(util.MentionType.ROLE, rid, False)
-			msg = "That emoji is already in use for the role " + str(existing_role) + "! Use !rr-add to try again."
-			raise BotModuleError(msg)
-		gr['emotes'][react.emoji] = role.id
-		self.set_group(sid, name, gr)
+			rid = gr['emotes'][react.emoji]
+			err_msg = "That emoji is already in use for the role <@&" + str(rid) + ">! Use !rr-add to try again."
+			raise BotModuleError(err_msg)
+		gr['emotes'][_intern_emoji(react.emoji)] = role.id
 
 		await msg.add_reaction(react.emoji_value)
 
@@ -495,78 +522,103 @@ class RoleManagerModule(BotBehaviorModule):
 		await bot.require_op('rr-clear')
 
 		sid = bot.get_guild().id
-		opts = [x for x in self._groups[sid].keys() if x is not None]
+		opts = (x for x in self._groups.get(sid, {}) if x is not None)
 		# TODO: abstract away the concept of "more than one option" and also abstract concept of auto-choosing 1 if only
 		# one and not presenting choice if choices are empty.
-		if len(opts) < 1:
+		sel = next(opts, None)
+		if sel is None:
 			await bot.reply("I don't have any reaction roles defined on any messages! You can use !rr-add to make one.")
 			return
-		elif len(opts) == 1:
-			sel = opts[0]
-		else:
-			opt1 = opts[0]
-			opt2 = opts[1]
-			other_opts = []
-			if len(opts) > 2:
-				other_opts = opts[2:]
+		opt2 = next(opts, None)
+		if opt2 is not None:
 			q = "Which role group should I completely remove?"
-			sel = await bot.prompt_for_option(q, opt1, opt2, *other_opts)
+			sel = await bot.prompt_for_option(q, sel, opt2, *opts)
 			if sel is None:
 				raise BotModuleError("Sorry, but I need to know what role group you want me to operate on!")
 
 		conf = await bot.confirm("Just to double check, you want me to delete ALL reaction roles in that group, right?")
 		if conf:
-			sid = bot.get_guild().id
-			del self._known_messages[sid][self._groups[sid][sel]['message']]
-			del self._groups[bot.get_guild().id][sel]
+			mid = self._groups[sid].pop(sel)['message']
+			self._known_messages[sid].pop(mid)
+			self._message_emotes.pop((sid, mid))
 			bot.save()
-			bot.unsubscribe_reactions(sel)
+			bot.unsubscribe_reactions(mid)
 			await bot.reply("Okay! They have been removed.")
 		else:
 			await bot.reply("I'll leave the role reactions alone for now.")
 
 
+async def add_group_reactions(bot: PluginAPI, msg: discord.Message, emotes: Dict[Union[str, int], int]):
+	emojis = await asyncio.gather(*(bot.get_emoji_from_value(em) for em in emotes))
+	# discord.py queues requests to the same route on a FIFO lock, so the reactions still land in group order; issuing
+	# them together just keeps each one from waiting on the previous round-trip before it is even queued.
+	await asyncio.gather(*(msg.add_reaction(em) for em in emojis))
+
+
 async def add_user_role(bot: PluginAPI, reaction: util.Reaction, role_id: int):
 	g = bot.get_guild()
-	role = g.get_role(role_id)
-	mem = g.get_member(reaction.user.id)
+	mem = g.get_member(reaction.user_id)
+
+	if mem is None:
+		raise BotModuleError("User is not a member of this guild: UID " + str(reaction.user_id))
+
+	# nothing to do if they already have it
+	if _member_has_role(mem, role_id):
+		return
 
+	role = g.get_role(role_id)
 	if role is None:
 		raise BotModuleError("Role does not exist: RID " + str(role_id))
 
-	if mem is None:
-		raise BotModuleError("User is not a member of this guild: UID " + str(reaction.user.id))
-
-	if role not in mem.roles:
-		await mem.add_roles(role, reason="Reaction roles request")
-		reply_msg = "Okay! I've added the role `@" + role.name + "` to you in " + g.name + "!"
-		reply_msg += " To remove it, just remove your reaction!"
-		await mem.send(reply_msg)
+	await mem.add_roles(role, reason="Reaction roles request")
+	reply_msg = (
+		"Okay! I've added the role `@" + role.name + "` to you in " + g.name + "!"
+		" To remove it, just remove your reaction!"
+	)
+	await mem.send(reply_msg)
 
 
 async def remove_user_role(bot: PluginAPI, reaction: util.Reaction, role_id: int):
 	g = bot.get_guild()
-	role = g.get_role(role_id)
-	mem = g.get_member(reaction.user.id)
+	mem = g.get_member(reaction.user_id)
+
+	if mem is None:
+		raise BotModuleError("User is not a member of this guild: UID " + str(reaction.user_id))
 
+	# nothing to do if they don't have it
+	if not _member_has_role(mem, role_id):
+		return
+
+	role = g.get_role(role_id)
 	if role is None:
 		raise BotModuleError("Role does not exist: RID " + str(role_id))
 
-	if mem is None:
-		raise BotModuleError("User is not a member of this guild: UID " + str(reaction.user.id))
+	await mem.remove_roles(role, reason="Reaction roles request")
+	reply_msg = (
+		"Okay! I've removed the role `@" + role.name + "` from you in " + g.name + "!"
+		" To have it added again, you can react once more!"
+	)
+	await mem.send(reply_msg)
+
+
+def _member_has_role(mem: discord.Member, role_id: int) -> bool:
+	# stops at the first match instead of building a set of every role ID the member has
+	return any(r.id == role_id for r in mem.roles)
+
 
-	if role in mem.roles:
-		await mem.remove_roles(role, reason="Reaction roles request")
-		reply_msg = "Okay! I've removed the role `@" + role.name + "` from you in " + g.name + "!"
-		reply_msg += " To have it added again, you can react once more!"
-		await mem.send(reply_msg)
+def _intern_emoji(emoji: Union[str, int]) -> Union[str, int]:
+	"""Intern unicode emoji so that every group using the same emoji shares one key object; IDs pass through."""
+	if isinstance(emoji, str):
+		return sys.intern(emoji)
+	return emoji
 
 
 def normalize_group_name(input: str) -> str:
 	norm = input
 	norm = norm.strip()
 	norm = norm.lower()
-	return re.sub('[^0-1A-Za-z_-]', '-', norm)
+	# names are kept for as long as their group exists and are used as keys everywhere, so intern them
+	return sys.intern(re.sub('[^0-1A-Za-z_-]', '-', norm))
 
 
 BOT_MODULE_CLASS = RoleManagerModule
@@ -4,32 +4,42 @@ from .. import util, settings
 from ..bot import PluginAPI
 
 
+import functools
 import logging
 import random
+from typing import Optional, Tuple
 
 
 _log = logging.getLogger(__name__)
 _log.setLevel(logging.DEBUG)
 
 
+_HELP_TEXT = (
+	"To roll the dice, use the `roll` command followed by the number of dice and sides to role in the"
+	" format <X>d<Y>. This will roll X number of Y-sided dice.\n\nExample: `roll 4d6` will roll 4"
+	" d6's.\n\nIf the number of dice is left out, a single die will be rolled. If the number of sides"
+	" is left out, d6 will be assumed. If no arguments are given, a single d6 is rolled.\n\n"
+	"__Settings__\n"
+	"I have some settings for this module, which can be set by using the `settings roll` command:\n"
+	"* `max-count` is the maximum number of dice that can be rolled at once. Setting it to less than 1"
+	" disables the dice limit entirely.\n"
+	"* `max-sides` is the maximum number of sides that a die can have. Setting it to less than 2"
+	" disables the side limit entirely."
+)
+
+_TOO_FEW_SIDES_MESSAGE = "I'm sorry, but that's just not possible! All dice have to have at least two sides!"
+
+# largest number of sides that random.choices() can draw from exactly
+_MAX_CHOICES_SIDES = 2 ** 53
+
+
 class DiceRollerModule(BotBehaviorModule):
 
 	def __init__(self, resource_root: str):
-		help_text = "To roll the dice, use the `roll` command followed by the number of dice and sides to role in the"
-		help_text += " format <X>d<Y>. This will roll X number of Y-sided dice.\n\nExample: `roll 4d6` will roll 4"
-		help_text += " d6's.\n\nIf the number of dice is left out, a single die will be rolled. If the number of sides"
-		help_text += " is left out, d6 will be assumed. If no arguments are given, a single d6 is rolled.\n\n"
-		help_text += "__Settings__\n"
-		help_text += "I have some settings for this module, which can be set by using the `settings roll` command:\n"
-		help_text += "* `max-count` is the maximum number of dice that can be rolled at once. Setting it to less than 1"
-		help_text += " disables the dice limit entirely.\n"
-		help_text += "* `max-sides` is the maximum number of sides that a die can have. Setting it to less than 2"
-		help_text += " disables the side limit entirely."
-
 		super().__init__(
 			name="roll",
 			desc="Rolls a number of dice",
-			help_text=help_text,
+			help_text=_HELP_TEXT,
 			triggers=[
 				InvocationTrigger('roll'),
 			],
@@ -57,40 +67,59 @@ class DiceRollerModule(BotBehaviorModule):
 		sides = 6
 		count = 1
 		if len(args) > 0:
-			try:
-				parts = args[0].split('d')
-				count = int(parts[0])
-				sides = int(parts[1])
-			except (IndexError, ValueError):
+			parsed_count, parsed_sides = _parse_roll(args[0])
+			if parsed_count is not None:
+				count = parsed_count
+			if parsed_sides is not None:
+				sides = parsed_sides
+			else:
 				msg += "Um, I'm sorry, but, well, that is not in XdY format, so I'll assume you mean 1d6, okay?\n\n"
 		if sides > max_sides > 1:
-			msg = "Uh oh! That's too many sides on a die! The most you can have right now is " + str(max_sides)
-			msg += "."
+			msg = "Uh oh! That's too many sides on a die! The most you can have right now is " + str(max_sides) + "."
 			await bot.reply(msg)
 		elif sides < 2:
-			msg = "I'm sorry, but that's just not possible! All dice have to have at"
-			msg += " least two sides!"
-			raise BotSyntaxError(msg)
+			raise BotSyntaxError(_TOO_FEW_SIDES_MESSAGE)
 		elif count > max_dice > 0:
-			msg = "Woah! That's way too many dice! Are you running Shadowrun or something? The most you can have right"
-			msg += " now is " + str(max_dice) + "."
+			msg = (
+				"Woah! That's way too many dice! Are you running Shadowrun or something? The most you can have right"
+				" now is " + str(max_dice) + "."
+			)
 			await bot.reply(msg)
 		elif count < 1:
-			msg = "Well, if you say so! I will roll " + str(count) + " dice! That is less than 1, so you automatically"
-			msg += " fail the roll. Not only that, but rocks fell down from the sky and now everybody is dead!\n\n"
-			msg += "...this is just awful... w-why would you make me do that? :c"
+			msg = (
+				"Well, if you say so! I will roll " + str(count) + " dice! That is less than 1, so you automatically"
+				" fail the roll. Not only that, but rocks fell down from the sky and now everybody is dead!\n\n"
+				"...this is just awful... w-why would you make me do that? :c"
+			)
 			await bot.reply(msg)
 		else:
-			rolls = ""
-			total = 0
-			for x in range(count):
-				r = random.randint(1, sides)
-				rolls += str(r) + ", "
-				total += r
+			if sides <= _MAX_CHOICES_SIDES:
+				# choices() draws all of the rolls in one call rather than going through randint() once per die
+				rolls = random.choices(range(1, sides + 1), k=count)
+			else:
+				# choices() scales a float by the number of sides, which overflows past this size
+				rolls = [random.randint(1, sides) for _ in range(count)]
 			msg += "All right! " + bot.mention_user() + " rolled {0:d}d{1:d}...\n"
 			msg += "{2:s}\nTotal: {3:d}"
-			msg = msg.format(count, sides, rolls[:-2], total)
+			msg = msg.format(count, sides, ", ".join(map(str, rolls)), sum(rolls))
 			await bot.reply(msg)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_roll(spec: str) -> Tuple[Optional[int], Optional[int]]:
+	"""
+	Parse an XdY roll into (count, sides). If it isn't in that format, sides is None, and count is None too unless
+	the X part was still readable.
+	"""
+	parts = spec.split('d')
+	try:
+		count = int(parts[0])
+	except ValueError:
+		return None, None
+	try:
+		return count, int(parts[1])
+	except (IndexError, ValueError):
+		return count, None
+
+
 BOT_MODULE_CLASS = DiceRollerModule
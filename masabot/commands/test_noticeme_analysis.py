@@ -4,6 +4,10 @@ from . import noticeme_analysis as analysis
 
 class TestNoticeMeAnalysis(TestCase):
 
+	def setUp(self):
+		analysis.analyze_sentiment.cache_clear()
+		analysis.contains_thanks.cache_clear()
+
 	def test_contains_thanks(self):
 		test_cases = [
 			("thanks <@1234>", True),
@@ -20,3 +24,21 @@ class TestNoticeMeAnalysis(TestCase):
 			fmt = "for {!r}; expected {:s}match but got {:s}match"
 			msg = fmt.format(message_text, "no " if not expected else "", "no " if not actual else "")
 			self.assertEqual(actual, expected, msg=msg)
+
+	def test_analyze_sentiment(self):
+		test_cases = [
+			("hi masabot", 0),
+			("good bot", 1),
+			("Thank you masabot", 1),
+			("masabot is smart", 1),
+			("bad bot", -1),
+			("masabot isn't working", -1),
+			("good bot but you're broken", -1),
+			("masabot is broken but cute", -1),
+			("masabot is goodness", 0),
+		]
+
+		for case in test_cases:
+			message_text, expected = case
+			actual = analysis.analyze_sentiment(message_text)
+			self.assertEqual(actual, expected, msg="for {!r}".format(message_text))
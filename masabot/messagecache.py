@@ -1,12 +1,62 @@
-from typing import Callable, List
+import collections
+import itertools
+from typing import Callable, Deque, Dict, List, Optional
 import discord
 
 
+class _History(object):
+	"""Saved messages for a single channel, oldest first."""
+
+	def __init__(self):
+		# bounded to the history limit so the oldest message falls off the front in O(1) when a new one is added
+		self.messages: Deque[discord.Message] = collections.deque(maxlen=0)
+
+		# message ID -> position of that message counting from the first one ever saved in the channel, so that
+		# entries stay valid when old messages are dropped off the front.
+		self.positions: Dict[int, int] = dict()
+
+		# position of messages[0]
+		self.start = 0
+
+	def append(self, message: discord.Message, limit: int):
+		limit = max(limit, 0)
+		if self.messages.maxlen != limit:
+			self._resize(limit)
+		if limit == 0:
+			return
+		pos = self.start + len(self.messages)
+		if len(self.messages) == limit:
+			# the deque is about to push this one out
+			self.positions.pop(self.messages[0].id, None)
+			self.start += 1
+		self.positions[message.id] = pos
+		self.messages.append(message)
+
+	def _resize(self, limit: int):
+		drop = max(len(self.messages) - limit, 0)
+		for m in itertools.islice(self.messages, drop):
+			self.positions.pop(m.id, None)
+		self.messages = collections.deque(self.messages, maxlen=limit)
+		self.start += drop
+
+	def newest_first(self, from_message: Optional[int] = None, limit: int = 0) -> List[discord.Message]:
+		end = len(self.messages)
+		if from_message is not None:
+			pos = self.positions.get(from_message)
+			if pos is not None:
+				end = pos - self.start + 1
+		begin = 0
+		if 0 < limit < end:
+			begin = end - limit
+		count = len(self.messages)
+		return list(itertools.islice(reversed(self.messages), count - end, count - begin))
+
+
 class MessageHistoryCache(object):
 	def __init__(self, get_limit: Callable[[], int]):
-		self._guilds = dict()
-		self._dms = dict()
-		self._groups = dict()
+		self._guilds: Dict[int, Dict[int, _History]] = dict()
+		self._dms: Dict[int, _History] = dict()
+		self._groups: Dict[int, _History] = dict()
 		self.get_limit = get_limit
 
 	def save(self, message: discord.Message):
@@ -17,43 +67,49 @@ class MessageHistoryCache(object):
 			if gid not in self._guilds:
 				self._guilds[gid] = dict()
 			if cid not in self._guilds[gid]:
-				self._guilds[gid][cid] = list()
-			self._guilds[gid][cid].append(message)
-			if len(self._guilds[gid][cid]) > self.get_limit():
-				start = len(self._guilds[gid][cid]) - self.get_limit()
-				self._guilds[gid][cid] = self._guilds[gid][cid][start:]
+				self._guilds[gid][cid] = _History()
+			self._guilds[gid][cid].append(message, self.get_limit())
 		elif isinstance(ch, discord.DMChannel):
 			uid = ch.recipient.id
 			if uid not in self._dms:
-				self._dms[uid] = list()
-			self._dms[uid].append(message)
-			if len(self._dms[uid]) > self.get_limit():
-				start = len(self._dms[uid]) - self.get_limit()
-				self._dms[uid] = self._dms[uid][start:]
+				self._dms[uid] = _History()
+			self._dms[uid].append(message, self.get_limit())
 		elif isinstance(ch, discord.GroupChannel):
 			cid = ch.id
 			if cid not in self._groups:
-				self._groups[cid] = list()
-			self._groups[cid].append(message)
-			if len(self._groups[cid]) > self.get_limit():
-				start = len(self._groups[cid]) - self.get_limit()
-				self._groups[cid] = self._groups[cid][start:]
+				self._groups[cid] = _History()
+			self._groups[cid].append(message, self.get_limit())
 		else:
 			raise TypeError("Cannot handle unknown message type in history cache: " + str(type(ch)))
 
-	def for_channel(self, guild_id: int, channel_id: int) -> List[discord.Message]:
+	def for_channel(
+			self,
+			guild_id: int,
+			channel_id: int,
+			from_message: Optional[int] = None,
+			limit: int = 0
+	) -> List[discord.Message]:
+		"""
+		Get the saved messages in a channel, newest first.
+
+		:param guild_id: The ID of the guild the channel is in.
+		:param channel_id: The ID of the channel.
+		:param from_message: If given and the message with this ID is saved, the list starts at that message instead
+		of at the newest one.
+		:param limit: If greater than 0, at most this many messages are returned.
+		"""
 		if guild_id not in self._guilds:
 			return list()
 		if channel_id not in self._guilds[guild_id]:
 			return list()
-		return list(reversed(self._guilds[guild_id][channel_id]))
+		return self._guilds[guild_id][channel_id].newest_first(from_message, limit)
 
 	def for_dm(self, user_id: int) -> List[discord.Message]:
 		if user_id not in self._dms:
 			return list()
-		return list(reversed(self._dms[user_id]))
+		return self._dms[user_id].newest_first()
 
 	def for_group(self, group_id: int) -> List[discord.Message]:
 		if group_id not in self._groups:
 			return list()
-		return list(reversed(self._groups[group_id]))
+		return self._groups[group_id].newest_first()
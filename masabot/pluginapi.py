@@ -588,23 +588,10 @@ class PluginAPI:
 
 		gid = self.get_guild().id
 		cid = self.get_channel().id
-		full_list = self.history.for_channel(gid, cid)
-
+		from_message = None
 		if from_current:
-			loc_idx = -1
-			idx = 0
-			for m in full_list:
-				if m.id == self.context.message.id:
-					loc_idx = idx
-					break
-				idx += 1
-			if loc_idx != -1:
-				full_list = full_list[loc_idx:]
-
-		if 0 < limit < len(full_list):
-			full_list = full_list[:limit]
-
-		return full_list
+			from_message = self.context.message.id
+		return self.history.for_channel(gid, cid, from_message=from_message, limit=limit)
 
 	def remove_timer(self, id: str):
 		"""Unregister a timer and stop it from firing until it is re-added with
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+from unittest import TestCase
+from . import messagecache
+
+
+def _history_of(ids, limit):
+	hist = messagecache._History()
+	for mid in ids:
+		hist.append(SimpleNamespace(id=mid), limit)
+	return hist
+
+
+def _ids(messages):
+	return [m.id for m in messages]
+
+
+class TestHistory(TestCase):
+
+	def test_eviction(self):
+		test_cases = [
+			([1, 2, 3], 5, [3, 2, 1]),
+			([1, 2, 3, 4, 5], 5, [5, 4, 3, 2, 1]),
+			([1, 2, 3, 4, 5, 6, 7], 5, [7, 6, 5, 4, 3]),
+			([1, 2, 3, 4, 5, 6, 7], 1, [7]),
+		]
+
+		for case in test_cases:
+			saved, limit, expected = case
+			hist = _history_of(saved, limit)
+			msg = "for {!r} with limit {:d}".format(saved, limit)
+			self.assertEqual(_ids(hist.newest_first()), expected, msg=msg)
+			# evicted messages must not be found as starting points any more
+			for mid in saved:
+				self.assertEqual(mid in hist.positions, mid in expected, msg=msg + ", message {:d}".format(mid))
+
+	def test_from_message_and_limit(self):
+		hist = _history_of([1, 2, 3, 4, 5, 6, 7], 5)
+		test_cases = [
+			(None, 0, [7, 6, 5, 4, 3]),
+			(None, 2, [7, 6]),
+			(5, 0, [5, 4, 3]),
+			(5, 2, [5, 4]),
+			(5, 10, [5, 4, 3]),
+			(3, 1, [3]),
+			# evicted and unknown messages fall back to starting at the newest
+			(2, 2, [7, 6]),
+			(100, 0, [7, 6, 5, 4, 3]),
+		]
+
+		for case in test_cases:
+			from_message, limit, expected = case
+			actual = _ids(hist.newest_first(from_message, limit))
+			self.assertEqual(actual, expected, msg="from {!r} with limit {:d}".format(from_message, limit))
+
+	def test_limit_change(self):
+		test_cases = [
+			# (limit while saving, new limit, next message, expected newest first)
+			(5, 3, 6, [6, 5, 4]),
+			(5, 8, 6, [6, 5, 4, 3, 2, 1]),
+			(3, 5, 6, [6, 5, 4, 3]),
+		]
+
+		for case in test_cases:
+			old_limit, new_limit, next_id, expected = case
+			hist = _history_of([1, 2, 3, 4, 5], old_limit)
+			hist.append(SimpleNamespace(id=next_id), new_limit)
+			msg = "from limit {:d} to {:d}".format(old_limit, new_limit)
+			self.assertEqual(_ids(hist.newest_first()), expected, msg=msg)
+			self.assertEqual(_ids(hist.newest_first(expected[-1])), [expected[-1]], msg=msg)
+
+	def test_non_positive_limit(self):
+		for limit in [0, -1]:
+			hist = _history_of([1, 2, 3], limit)
+			msg = "for limit {:d}".format(limit)
+			self.assertEqual(hist.newest_first(), [], msg=msg)
+			self.assertEqual(hist.positions, {}, msg=msg)
+
+		# dropping the limit to nothing clears what was already saved
+		hist = _history_of([1, 2, 3], 5)
+		hist.append(SimpleNamespace(id=4), 0)
+		self.assertEqual(hist.newest_first(), [])
+		self.assertEqual(hist.positions, {})
+
+
+class TestMessageHistoryCache(TestCase):
+
+	def test_unknown_channel(self):
+		cache = messagecache.MessageHistoryCache(lambda: 5)
+		self.assertEqual(cache.for_channel(1, 2), [])
+		self.assertEqual(cache.for_dm(1), [])
+		self.assertEqual(cache.for_group(1), [])